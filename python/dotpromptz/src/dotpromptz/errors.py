@@ -105,16 +105,9 @@ class ResolverFailedError(RuntimeError):
         self.name = name
         self.kind = kind
         self.reason = reason
+        # RuntimeError.__str__ returns this message as is.
         super().__init__(f'{kind} resolver failed for {name}; {reason}')
 
-    def __str__(self) -> str:
-        """Return a human-readable error message.
-
-        Returns:
-            A formatted string describing the resolution failure.
-        """
-        return f'{self.kind} resolver failed for {self.name}; {self.reason}'
-
     def __repr__(self) -> str:
         """Return a detailed string representation for debugging.
 
@@ -41,20 +41,28 @@ See Also:
     Full Picoschema reference: https://google.github.io/dotprompt/extending/picoschema/
 """
 
-import re
+import functools
 from typing import Any, cast
 
+import anyio
+
 from dotpromptz.resolvers import resolve_json_schema
 from dotpromptz.typing import JsonSchema, SchemaResolver
 
-JSON_SCHEMA_SCALAR_TYPES = [
+JSON_SCHEMA_SCALAR_TYPES = frozenset({
     'any',
     'boolean',
     'integer',
     'null',
     'number',
     'string',
-]
+})
+
+_JSON_SCHEMA_TYPES = JSON_SCHEMA_SCALAR_TYPES | {'object', 'array'}
+
+# Templates for scalar leaves; copied, never returned directly, since callers
+# may add descriptions or nullability to the result.
+_SCALAR_SCHEMAS: dict[str, JsonSchema] = {t: {} if t == 'any' else {'type': t} for t in JSON_SCHEMA_SCALAR_TYPES}
 
 WILDCARD_PROPERTY_NAME = '(*)'
 
@@ -68,11 +76,10 @@ def _is_json_schema(schema: dict[str, Any]) -> bool:
     Returns:
         True if the schema is already in JSON Schema format, False otherwise.
     """
-    types = JSON_SCHEMA_SCALAR_TYPES + ['object', 'array']
     return (
         isinstance(schema, dict)  # force format
         and isinstance(schema.get('type'), str)  # force format
-        and schema['type'] in types  # force format
+        and schema['type'] in _JSON_SCHEMA_TYPES  # force format
     )
 
 
@@ -86,7 +93,8 @@ async def picoschema_to_json_schema(schema: Any, schema_resolver: SchemaResolver
     Returns:
         The equivalent JSON Schema, or None if the input schema is None.
     """
-    return await PicoschemaParser(schema_resolver).parse(schema)
+    parser = _DEFAULT_PARSER if schema_resolver is None else PicoschemaParser(schema_resolver)
+    return await parser.parse(schema)
 
 
 class PicoschemaParser:
@@ -136,13 +144,14 @@ class PicoschemaParser:
             schema: The schema definition to parse.
 
         Returns:
-            The resulting JSON Schema, or None if the input is None.
+            The resulting JSON Schema, or None if the input is None or an
+            empty string.
         """
-        if not schema:
+        if schema is None or schema == '':
             return None
 
         if isinstance(schema, str):
-            type_name, description = extract_description(schema)
+            type_name, description = _parse_type_string(schema)
             if type_name in JSON_SCHEMA_SCALAR_TYPES:
                 out: JsonSchema = {'type': type_name}
                 if description:
@@ -161,11 +170,17 @@ class PicoschemaParser:
         return await self.parse_pico(schema)
 
     async def parse_pico(self, obj: Any, path: list[str] | None = None) -> JsonSchema:
-        """Recursively parses a Picoschema object or string fragment.
+        """Parses a Picoschema object or string fragment.
+
+        Named schema references are resolved up front, concurrently and once
+        per distinct name; the fragment itself is then compiled synchronously.
+        When no resolver is configured, no coroutines are created beyond this
+        one.
 
         Args:
             obj: The Picoschema fragment (dict or string).
-            path: The current path within the schema structure (for error reporting).
+            path: The path of the fragment within the enclosing schema.
+                  Retained for API compatibility; not used.
 
         Returns:
             The JSON Schema representation of the fragment.
@@ -173,76 +188,183 @@ class PicoschemaParser:
         Raises:
             ValueError: If the schema structure is invalid.
         """
-        if path is None:
-            path = []
+        resolved: dict[str, JsonSchema] = {}
+        if self._schema_resolver is not None:
+            # Each distinct name is resolved once, and all of them concurrently.
+            # The first failure cancels the remaining lookups and is re-raised
+            # as is rather than wrapped in an exception group.
+            errors: list[Exception] = []
+
+            async def _resolve(name: str) -> None:
+                try:
+                    resolved[name] = await self.must_resolve_schema(name)
+                except Exception as e:
+                    errors.append(e)
+                    tg.cancel_scope.cancel()
+
+            async with anyio.create_task_group() as tg:
+                for name in dict.fromkeys(self._schema_refs(obj)):
+                    tg.start_soon(_resolve, name)
+            if errors:
+                raise errors[0]
+        return self._parse_pico_sync(obj, resolved)
+
+    def _schema_refs(self, obj: Any) -> list[str]:
+        """Collects the named schema references in a Picoschema fragment.
+
+        Args:
+            obj: The Picoschema fragment (dict or string).
+
+        Returns:
+            The non-scalar type names referenced by the fragment, in order.
+        """
+        refs: list[str] = []
+        stack: list[Any] = [obj]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                type_name, _ = _parse_type_string(node)
+                if type_name not in JSON_SCHEMA_SCALAR_TYPES:
+                    refs.append(type_name)
+            elif isinstance(node, dict):
+                children = []
+                for key, value in node.items():
+                    paren = key.find('(')
+                    type_info = key[paren + 1 : -1] if paren >= 0 else None
+                    if type_info and _parse_type_string(type_info)[0] == 'enum':
+                        continue
+                    children.append(value)
+                stack.extend(reversed(children))
+        return refs
+
+    def _parse_pico_sync(self, obj: Any, resolved: dict[str, JsonSchema]) -> JsonSchema:
+        """Compiles a Picoschema fragment without awaiting.
+
+        Nested objects are compiled with an explicit work stack: each nested
+        object gets an empty output dict that is filled in when its work item
+        is popped, so schema depth does not consume Python frames.
+
+        Args:
+            obj: The Picoschema fragment (dict or string).
+            resolved: Named schemas already fetched from the resolver.
+
+        Returns:
+            The JSON Schema representation of the fragment.
+
+        Raises:
+            ValueError: If the schema structure is invalid or references a
+                        schema that has not been resolved.
+        """
+        if not isinstance(obj, dict):
+            return self._parse_pico_leaf(obj, resolved)
+
+        root: JsonSchema = {}
+        # (output schema, picoschema object, nullable, description)
+        stack: list[tuple[JsonSchema, dict[str, Any], bool, str | None]] = [(root, obj, False, None)]
+
+        def visit(value: Any, nullable: bool = False, description: str | None = None) -> JsonSchema:
+            if isinstance(value, dict):
+                out: JsonSchema = {}
+                stack.append((out, value, nullable, description))
+                return out
+            return self._parse_pico_leaf(value, resolved)
+
+        while stack:
+            schema, node, nullable, node_description = stack.pop()
+            props: dict[str, Any] = {}
+            required: list[str] = []
+            additional_properties: Any = False
+
+            for key, value in node.items():
+                if key == WILDCARD_PROPERTY_NAME:
+                    additional_properties = visit(value)
+                    continue
+
+                paren = key.find('(')
+                if paren < 0:
+                    name, type_info = key, None
+                else:
+                    name, type_info = key[:paren], key[paren + 1 : -1]
+                is_optional = name[-1:] == '?'
+                property_name = name[:-1] if is_optional else name
+
+                if not is_optional:
+                    required.append(property_name)
+
+                if not type_info:
+                    prop = visit(value, is_optional)
+                    if is_optional and isinstance(prop.get('type'), str):
+                        prop['type'] = [prop['type'], 'null']
+                    props[property_name] = prop
+                    continue
+
+                type_name, description = _parse_type_string(type_info)
+                if type_name == 'array':
+                    prop = {
+                        'type': ['array', 'null'] if is_optional else 'array',
+                        'items': visit(value),
+                    }
+                elif type_name == 'object':
+                    if isinstance(value, dict):
+                        # The description is added once the nested object is filled.
+                        prop = visit(value, is_optional, description)
+                        description = None
+                    else:
+                        prop = visit(value)
+                        if is_optional:
+                            prop['type'] = [prop['type'], 'null']
+                elif type_name == 'enum':
+                    prop = {'enum': value}
+                    if is_optional and None not in prop['enum']:
+                        prop['enum'].append(None)
+                else:
+                    raise ValueError(f"Picoschema: parenthetical types must be 'object' or 'array', got: {type_name}")
+
+                if description:
+                    prop['description'] = description
+                props[property_name] = prop
 
-        if isinstance(obj, str):
-            type_name, description = extract_description(obj)
-            if type_name not in JSON_SCHEMA_SCALAR_TYPES:
-                resolved_schema = await self.must_resolve_schema(type_name)
-                return {**resolved_schema, 'description': description} if description else resolved_schema
+            schema['type'] = ['object', 'null'] if nullable else 'object'
+            schema['properties'] = props
+            if required:
+                schema['required'] = required
+            schema['additionalProperties'] = additional_properties
+            if node_description:
+                schema['description'] = node_description
 
-            if type_name == 'any':
-                return {'description': description} if description else {}
+        return root
+
+    def _parse_pico_leaf(self, obj: Any, resolved: dict[str, JsonSchema]) -> JsonSchema:
+        """Compiles a Picoschema type string.
+
+        Args:
+            obj: The Picoschema type string.
+            resolved: Named schemas already fetched from the resolver.
 
-            return {'type': type_name, 'description': description} if description else {'type': type_name}
-        elif not isinstance(obj, dict):
+        Returns:
+            The JSON Schema representation of the type string.
+
+        Raises:
+            ValueError: If the input is not a string or references a schema
+                        that has not been resolved.
+        """
+        if not isinstance(obj, str):
             raise ValueError(f'Picoschema: only consists of objects and strings. Got: {obj}')
 
-        schema: dict[str, Any] = {
-            'type': 'object',
-            'properties': {},
-            'required': [],
-            'additionalProperties': False,
-        }
-
-        for key, value in obj.items():
-            if key == WILDCARD_PROPERTY_NAME:
-                schema['additionalProperties'] = await self.parse_pico(value, [*path, key])
-                continue
-
-            parts = key.split('(')
-            name = parts[0]
-            type_info = parts[1][:-1] if len(parts) > 1 else None
-            is_optional = name.endswith('?')
-            property_name = name[:-1] if is_optional else name
-
-            if not is_optional:
-                schema['required'].append(property_name)
-
-            if not type_info:
-                prop = await self.parse_pico(value, [*path, key])
-                if is_optional and isinstance(prop.get('type'), str):
-                    prop['type'] = [prop['type'], 'null']
-                schema['properties'][property_name] = prop
-                continue
-
-            type_name, description = extract_description(type_info)
-            if type_name == 'array':
-                prop = await self.parse_pico(value, [*path, key])
-                schema['properties'][property_name] = {
-                    'type': ['array', 'null'] if is_optional else 'array',
-                    'items': prop,
-                }
-            elif type_name == 'object':
-                prop = await self.parse_pico(value, [*path, key])
-                if is_optional:
-                    prop['type'] = [prop['type'], 'null']
-                schema['properties'][property_name] = prop
-            elif type_name == 'enum':
-                prop = {'enum': value}
-                if is_optional and None not in prop['enum']:
-                    prop['enum'].append(None)
-                schema['properties'][property_name] = prop
-            else:
-                raise ValueError(f"Picoschema: parenthetical types must be 'object' or 'array', got: {type_name}")
-
-            if description:
-                schema['properties'][property_name]['description'] = description
-
-        if not schema['required']:
-            del schema['required']
-        return schema
+        type_name, description = _parse_type_string(obj)
+        template = _SCALAR_SCHEMAS.get(type_name)
+        if template is None:
+            if type_name not in resolved:
+                raise ValueError(f"Picoschema: unsupported scalar type '{type_name}'.")
+            template = resolved[type_name]
+
+        out = template.copy()
+        if description:
+            out['description'] = description
+        return out
+
+
+_DEFAULT_PARSER = PicoschemaParser()
 
 
 def extract_description(input_str: str) -> tuple[str, str | None]:
@@ -256,11 +378,20 @@ def extract_description(input_str: str) -> tuple[str, str | None]:
     Returns:
         A tuple containing the type/name and the description (or None).
     """
-    if ',' not in input_str:
+    head, sep, tail = input_str.partition(',')
+    if not sep:
         return input_str, None
+    return head, tail.lstrip(' ')
 
-    match = re.match(r'(.*?), *(.*)$', input_str)
-    if match:
-        return match.group(1), match.group(2)
-    else:
-        return input_str, None
+
+@functools.lru_cache(maxsize=512)
+def _parse_type_string(type_str: str) -> tuple[str, str | None]:
+    """Cached `extract_description` for the type strings repeated across schemas.
+
+    Args:
+        type_str: The Picoschema type string, e.g. "string, a name".
+
+    Returns:
+        A tuple containing the type/name and the description (or None).
+    """
+    return extract_description(type_str)
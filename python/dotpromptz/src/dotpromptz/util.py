@@ -107,9 +107,13 @@ import unicodedata
 from typing import Any
 from urllib.parse import unquote as url_unquote
 
-import structlog
+# Names made only of these characters, with none of the suspicious sequences
+# below, can never trip the full validation and skip decoding/normalization.
+_PLAIN_NAME_RE = re.compile(r'[A-Za-z0-9_\-./]+')
+_PLAIN_NAME_REJECT_RE = re.compile(r'^/|/$|\.\.|\./')
 
-logger = structlog.get_logger(__name__)
+# Segments like 'a..b' or 'file..txt' are legitimate names, not traversal.
+_ALNUM_DOTS_SEGMENT_RE = re.compile(r'[a-zA-Z0-9]+\.\.[a-zA-Z0-9]+')
 
 
 def remove_undefined_fields(obj: Any) -> Any:
@@ -120,28 +124,54 @@ def remove_undefined_fields(obj: Any) -> Any:
     structures.  For lists, it removes None elements and processes nested
     structures.  For primitive types and None, it returns the value as is.
 
+    Nested structures are walked with an explicit stack rather than recursive
+    calls, so arbitrarily deep metadata does not hit the recursion limit. A
+    dict or list reachable through several paths (e.g. shared defaults) is
+    processed once, and its cleaned copy is shared in the output the same way.
+    Subclasses such as `OrderedDict` are cleaned too and come back as plain
+    dicts and lists.
+
     Args:
         obj: The object to process.
 
     Returns:
         The object with undefined fields removed.
     """
-    if obj is None or not isinstance(obj, dict | list):
+    kind = type(obj)
+    if kind is not dict and kind is not list and not isinstance(obj, dict | list):
         return obj
 
-    # Lists.
-    if isinstance(obj, list):
-        return [remove_undefined_fields(item) for item in obj if item is not None]
-
-    # Dicts.
-    result = {}
-    for key, value in obj.items():
-        if value is not None:
-            result[key] = remove_undefined_fields(value)
-    return result
-
-
-_QUOTE_PAIRS: set[tuple[str, str]] = {('"', '"'), ("'", "'")}
+    # Sentinel parent so the root is handled like any other node.
+    root: dict[str, Any] = {'_': obj}
+    stack: list[tuple[Any, Any, Any]] = [(root, '_', obj)]
+    # id(input container) -> (input container, cleaned copy). Holding the
+    # input keeps its id from being reused for another object during the walk.
+    memo: dict[int, tuple[Any, Any]] = {}
+    while stack:
+        parent, key, value = stack.pop()
+        seen = memo.get(id(value))
+        if seen is not None:
+            parent[key] = seen[1]
+            continue
+
+        out: Any
+        if type(value) is dict or isinstance(value, dict):
+            out = {}
+            for k, v in value.items():
+                if v is not None:
+                    out[k] = v
+                    t = type(v)
+                    if t is dict or t is list or isinstance(v, dict | list):
+                        stack.append((out, k, v))
+        else:
+            out = [item for item in value if item is not None]
+            for i, item in enumerate(out):
+                t = type(item)
+                if t is dict or t is list or isinstance(item, dict | list):
+                    stack.append((out, i, item))
+        memo[id(value)] = (value, out)
+        parent[key] = out
+    return root['_']
 
 
 def unquote(value: str, pairs: set[tuple[str, str]] | None = None) -> str:
@@ -155,10 +185,16 @@ def unquote(value: str, pairs: set[tuple[str, str]] | None = None) -> str:
     Returns:
         The string with quotes removed.
     """
+    str_value = value if isinstance(value, str) else str(value)
     if pairs is None:
-        pairs = _QUOTE_PAIRS
+        # Default pairs are single, symmetric characters: compare the ends.
+        if not str_value:
+            return str_value
+        first = str_value[0]
+        if (first == '"' or first == "'") and str_value[-1] == first:
+            return str_value[1:-1]
+        return str_value
 
-    str_value = str(value)
     for start, end in pairs:
         if str_value.startswith(start) and str_value.endswith(end):
             return str_value[len(start) : -len(end)]
@@ -184,8 +220,12 @@ def validate_prompt_name(name: str) -> None:
     if not name:
         raise ValueError('Prompt name cannot be empty')
 
+    # Fast path: plain names like 'prompts/greeting' are always valid.
+    if _PLAIN_NAME_RE.fullmatch(name) and not _PLAIN_NAME_REJECT_RE.search(name):
+        return
+
     # Check for whitespace-only names
-    if not name.strip():
+    if name.isspace():
         raise ValueError(f"Invalid prompt name: '{name}'")
 
     # Check for null bytes
@@ -201,11 +241,10 @@ def validate_prompt_name(name: str) -> None:
     # This catches bypasses like %2e%2e which decodes to ..
     # SECURITY: Decode iteratively to catch double-encoding bypasses (%252e%252e)
     decoded = name
-    for _ in range(3):  # Max 3 iterations to prevent DoS
-        new_decoded = url_unquote(decoded)
-        if new_decoded == decoded:
-            break
-        decoded = new_decoded
+    iterations = 0
+    while '%' in decoded and iterations < 3:  # Max 3 iterations to prevent DoS
+        decoded = url_unquote(decoded)
+        iterations += 1
     # Check for remaining encoded characters (potential double-encoding bypass)
     if '%' in decoded:
         raise ValueError(f"Invalid prompt name: encoded characters not allowed: '{name}'")
@@ -215,7 +254,8 @@ def validate_prompt_name(name: str) -> None:
     # This catches homograph attacks where visually similar characters
     # are used to bypass validation
     # Note: NFC doesn't convert all Unicode dots, so we check for suspicious patterns
-    normalized = unicodedata.normalize('NFC', name)
+    # ASCII strings are already in NFC form.
+    normalized = name if name.isascii() else unicodedata.normalize('NFC', name)
 
     # Check for current directory reference patterns
     if './' in normalized or '.\\' in normalized:
@@ -227,7 +267,9 @@ def validate_prompt_name(name: str) -> None:
     # - Segments STARTING with "..": "..config", "..hidden" (leading parent reference)
     # - Segments ENDING with ".." when followed by non-alphanumeric: "safe..", "0.."
     # Allows: "a..b", "file..txt", "...test", "test..." (legitimate filename patterns)
-    segments = normalized.replace('\\', '/').split('/')
+    # Backslashes are separators too (Windows-style paths).
+    slashed = normalized.replace('\\', '/')
+    segments = slashed.split('/')
     for seg in segments:
         # Check if segment is ONLY dots (2 or more)
         if len(seg) >= 2 and all(c == '.' for c in seg):
@@ -238,7 +280,7 @@ def validate_prompt_name(name: str) -> None:
         # Block only if it starts with exactly ".." (2 dots) not "...", "...." etc
         if len(seg) > 2 and seg[0] == '.' and seg[1] == '.' and seg[2] != '.':
             # Starts with exactly ".." followed by non-dot - check if valid pattern
-            if not re.match(r'^[a-zA-Z0-9]+\.\.[a-zA-Z0-9]+$', seg):
+            if not _ALNUM_DOTS_SEGMENT_RE.fullmatch(seg):
                 raise ValueError(f"Path traversal not allowed: '{name}'")
 
         # Check if segment ENDS with ".." (potential bypass: "safe..", "0..", "test..")
@@ -246,8 +288,9 @@ def validate_prompt_name(name: str) -> None:
         # Also allow trailing three-or-more dots like "test..." (valid filename pattern)
         if seg.endswith('..') and len(seg) > 2:
             # Allow if: alphanumeric..alphanumeric (has chars after ..) OR ends with 3+ dots
-            has_chars_after = bool(re.match(r'^[a-zA-Z0-9]+\.\.[a-zA-Z0-9]+$', seg))
-            has_trailing_triple = bool(re.match(r'.*\.\.\.+$', seg))
+            has_chars_after = _ALNUM_DOTS_SEGMENT_RE.fullmatch(seg) is not None
+            # Same as re.match(r'.*\.\.\.+$', seg): '.' never matches a newline.
+            has_trailing_triple = '\n' not in seg and seg.endswith('...')
             if not has_chars_after and not has_trailing_triple:
                 raise ValueError(f"Path traversal not allowed: '{name}'")
 
@@ -256,8 +299,7 @@ def validate_prompt_name(name: str) -> None:
         raise ValueError(f"Invalid path: absolute paths not allowed: '{name}'")
 
     # Check for trailing slash (after normalization to catch both / and \)
-    normalized_for_slash_check = normalized.replace('\\', '/')
-    if normalized_for_slash_check.endswith('/'):
+    if slashed.endswith('/'):
         raise ValueError(f"Invalid path: trailing slash not allowed: '{name}'")
 
     # Check for Windows absolute paths (e.g., C:/, C:\) - use normalized to catch URL-encoded
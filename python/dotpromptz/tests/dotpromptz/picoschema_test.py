@@ -16,9 +16,13 @@
 
 """Tests for picoschema functionality."""
 
+import sys
 import unittest
+from typing import Any
 from unittest import IsolatedAsyncioTestCase
 
+import anyio
+
 from dotpromptz import picoschema
 from dotpromptz.typing import JsonSchema
 
@@ -66,6 +70,15 @@ class TestPicoschemaParser(IsolatedAsyncioTestCase):
         """Test parsing None returns None."""
         self.assertIsNone(await self.parser.parse(None))
 
+    async def test_parse_empty_object_schema(self) -> None:
+        """Test parsing an empty dict yields an empty object schema."""
+        result = await self.parser.parse({})
+        self.assertEqual(result, {'type': 'object', 'properties': {}, 'additionalProperties': False})
+
+    async def test_parse_empty_string_schema(self) -> None:
+        """Test parsing an empty string yields None."""
+        self.assertIsNone(await self.parser.parse(''))
+
     async def test_parse_scalar_type_schema(self) -> None:
         """Test parsing a scalar type string."""
         result = await self.parser.parse('string')
@@ -316,6 +329,74 @@ class TestPicoschemaParser(IsolatedAsyncioTestCase):
         }
         self.assertEqual(await parser_with_resolver.parse_pico(schema), expected)
 
+    async def test_parse_pico_without_refs_skips_resolver(self) -> None:
+        """Test that schemas with only scalar types never call the resolver."""
+        calls: list[str] = []
+
+        async def mock_resolver(name: str) -> JsonSchema | None:
+            calls.append(name)
+            return None
+
+        parser_with_resolver = picoschema.PicoschemaParser(schema_resolver=mock_resolver)
+        schema = {'name': 'string', 'tags(array)': 'string', 'status(enum)': ['Custom']}
+        await parser_with_resolver.parse_pico(schema)
+        self.assertEqual(calls, [])
+
+    async def test_parse_pico_resolves_each_named_schema_once(self) -> None:
+        """Test that repeated references share a single resolver call."""
+        calls: list[str] = []
+
+        async def mock_resolver(name: str) -> JsonSchema | None:
+            calls.append(name)
+            return {'type': 'object', 'properties': {'id': {'type': 'string'}}}
+
+        parser_with_resolver = picoschema.PicoschemaParser(schema_resolver=mock_resolver)
+        schema = {'author': 'User', 'reviewers(array)': 'User', 'editor?(object)': 'User, the editor'}
+        result = await parser_with_resolver.parse_pico(schema)
+        self.assertEqual(calls, ['User'])
+        self.assertEqual(result['properties']['author']['type'], 'object')
+        self.assertEqual(result['properties']['editor']['type'], ['object', 'null'])
+        self.assertEqual(result['properties']['reviewers']['items']['type'], 'object')
+
+    async def test_parse_pico_resolver_failure_cancels_others(self) -> None:
+        """Test that a failing lookup cancels the others and raises as is."""
+        cancelled: list[str] = []
+
+        async def mock_resolver(name: str) -> JsonSchema | None:
+            if name == 'Missing':
+                return None
+            try:
+                await anyio.sleep_forever()
+            finally:
+                cancelled.append(name)
+            return None
+
+        parser = picoschema.PicoschemaParser(schema_resolver=mock_resolver)
+        with anyio.fail_after(5), self.assertRaises(LookupError) as context:
+            await parser.parse_pico({'slow': 'Slow', 'missing': 'Missing'})
+        self.assertEqual(str(context.exception), "schema resolver for 'Missing' returned None")
+        self.assertEqual(cancelled, ['Slow'])
+
+    async def test_parse_pico_unknown_type_without_resolver(self) -> None:
+        """Test error on a named type when no resolver is configured."""
+        with self.assertRaises(ValueError) as context:
+            await self.parser.parse_pico({'field': 'Unknown'})
+        self.assertEqual(str(context.exception), "Picoschema: unsupported scalar type 'Unknown'.")
+
+    async def test_parse_pico_deeply_nested_object(self) -> None:
+        """Test nesting deeper than the interpreter recursion limit."""
+        depth = sys.getrecursionlimit() * 2
+        schema: dict[str, Any] = {'leaf': 'string'}
+        for _ in range(depth):
+            schema = {'child?': schema}
+
+        result = await self.parser.parse_pico(schema)
+        for _ in range(depth):
+            self.assertNotIn('required', result)
+            result = result['properties']['child']
+            self.assertEqual(result['type'], ['object', 'null'])
+        self.assertEqual(result['properties'], {'leaf': {'type': 'string'}})
+
     async def test_invalid_input_type(self) -> None:
         """Test error on invalid input type to parse."""
         with self.assertRaises(ValueError):
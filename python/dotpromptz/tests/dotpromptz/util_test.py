@@ -16,7 +16,10 @@
 
 """Tests for utility functions."""
 
+import sys
 import unittest
+from collections import OrderedDict, defaultdict
+from typing import Any
 
 from dotpromptz.util import (
     remove_undefined_fields,
@@ -108,6 +111,56 @@ class TestRemoveUndefinedFields(unittest.TestCase):
         self.assertEqual(remove_undefined_fields({'a': {}}), {'a': {}})
         self.assertEqual(remove_undefined_fields({'a': []}), {'a': []})
 
+    def test_remove_undefined_fields_shared_subtree(self) -> None:
+        """Test that a shared sub-structure is cleaned once and stays shared."""
+        defaults = {'temperature': 0.5, 'stop': None, 'tags': ['a', None]}
+        input_data = {'base': defaults, 'override': defaults, 'list': [defaults, None]}
+        result = remove_undefined_fields(input_data)
+        cleaned = {'temperature': 0.5, 'tags': ['a']}
+        self.assertEqual(result, {'base': cleaned, 'override': cleaned, 'list': [cleaned]})
+        self.assertIs(result['base'], result['override'])
+        self.assertIs(result['base'], result['list'][0])
+        self.assertIn('stop', defaults)
+
+    def test_remove_undefined_fields_subclasses(self) -> None:
+        """Test that dict and list subclasses are cleaned into plain containers."""
+
+        class Items(list[Any]):
+            pass
+
+        nested: defaultdict[str, Any] = defaultdict(list, {'c': None, 'd': 2})
+        input_data = OrderedDict(a=None, b=1, nested=nested, items=Items([None, 3]))
+        result = remove_undefined_fields(input_data)
+        self.assertEqual(result, {'b': 1, 'nested': {'d': 2}, 'items': [3]})
+        self.assertIs(type(result), dict)
+        self.assertIs(type(result['nested']), dict)
+        self.assertIs(type(result['items']), list)
+        self.assertEqual(remove_undefined_fields(OrderedDict(a=None, b=1)), {'b': 1})
+
+    def test_remove_undefined_fields_cycle(self) -> None:
+        """Test that self-referencing structures terminate."""
+        input_data: dict[str, Any] = {'a': 1, 'b': None}
+        input_data['self'] = input_data
+        result = remove_undefined_fields(input_data)
+        self.assertEqual(result['a'], 1)
+        self.assertNotIn('b', result)
+        self.assertIs(result['self'], result)
+
+    def test_remove_undefined_fields_deeply_nested(self) -> None:
+        """Test nesting deeper than the interpreter recursion limit."""
+        depth = sys.getrecursionlimit() * 2
+        input_data: dict[str, Any] = {}
+        node = input_data
+        for _ in range(depth):
+            node['child'] = {'drop': None}
+            node = node['child']
+
+        result = remove_undefined_fields(input_data)
+        for _ in range(depth):
+            self.assertNotIn('drop', result)
+            result = result['child']
+        self.assertEqual(result, {})
+
 
 class TestUnquote(unittest.TestCase):
     """Tests for unquote."""
@@ -139,6 +192,15 @@ class TestUnquote(unittest.TestCase):
         self.assertEqual(unquote('""test\'test""'), '"test\'test"')
         self.assertEqual(unquote("''test\"test''"), "'test\"test'")
 
+    def test_unquote_custom_pairs(self) -> None:
+        """Test that custom pairs are honoured."""
+        self.assertEqual(unquote('[test]', {('[', ']')}), 'test')
+        self.assertEqual(unquote('"test"', {('[', ']')}), '"test"')
+
+    def test_unquote_non_string(self) -> None:
+        """Test that non-string values are converted to strings."""
+        self.assertEqual(unquote(42), '42')  # type: ignore[arg-type]
+
 
 class TestValidatePromptName(unittest.TestCase):
     """Tests for validate_prompt_name."""
@@ -178,6 +240,22 @@ class TestValidatePromptName(unittest.TestCase):
         with self.assertRaises(ValueError):
             validate_prompt_name('..\\../etc/passwd')
 
+    def test_rejects_current_directory_reference(self) -> None:
+        """Should reject './' even when the name is otherwise plain."""
+        for name in ('a/./b', 'a./b', './config'):
+            with self.assertRaises(ValueError):
+                validate_prompt_name(name)
+
+    def test_rejects_trailing_dots_after_newline(self) -> None:
+        """Should reject segments whose trailing dots follow a newline."""
+        for name in ('a\n...', '\n....', 'a\n%2e..'):
+            with self.assertRaises(ValueError):
+                validate_prompt_name(name)
+
+    def test_allows_trailing_triple_dots(self) -> None:
+        """Should allow a segment ending in three or more dots."""
+        validate_prompt_name('test...')
+
     def test_rejects_empty_string(self) -> None:
         """Should reject empty string."""
         with self.assertRaises(ValueError):
@@ -222,6 +300,10 @@ class TestValidatePromptName(unittest.TestCase):
         """Should allow legitimate subdirectory paths."""
         validate_prompt_name('subdir/nested')
 
+    def test_allows_backslash_separated_path(self) -> None:
+        """Should treat backslashes as separators, not reject them."""
+        validate_prompt_name('subdir\\prompt')
+
     def test_allows_deep_nesting(self) -> None:
         """Should allow deeply nested legitimate paths."""
         validate_prompt_name('subdir/deeply/nested/prompt')
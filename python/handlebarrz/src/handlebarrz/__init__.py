@@ -85,6 +85,11 @@ from ._native import (
     no_escape,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 logger = structlog.get_logger(__name__)
 
 
@@ -92,6 +97,36 @@ HelperFn = Callable[[list[Any], 'HelperOptions'], str]
 NativeHelperFn = Callable[[str, HandlebarrzHelperOptions], str]
 Context = dict[str, Any]
 
+# Matches `{{@variable}}` references rewritten by `Template.render_template`.
+_LOCAL_VARIABLE_RE = re.compile(r'{{@.*?}}')
+
+
+def _dumps(data: Any) -> str:
+    """Serialize render data to the JSON string the native renderer expects.
+
+    Uses orjson when it is installed and falls back to the standard library
+    for anything orjson refuses, such as integers wider than 64 bits or
+    non-string keys. Dates and dataclasses raise `TypeError` on both paths.
+    With orjson, `Enum` members and `UUID`s are encoded as their values and
+    NaN and infinity as `null`, where `json.dumps` raises `TypeError` or
+    emits literals the renderer rejects.
+
+    Args:
+        data: The data to serialize.
+
+    Returns:
+        The JSON encoded data.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data)
+
 
 class RuntimeOptions(TypedDict):
     """Options for the runtime of a Handlebars template.
@@ -462,7 +497,7 @@ class Template:
         # TODO(#502): options is currently ignored; need to add support for it.
 
         try:
-            result = self._template.render(name, json.dumps(data))
+            result = self._template.render(name, _dumps(data))
             logger.debug({'event': 'template_rendered', 'name': name})
             return result
         except ValueError as e:
@@ -508,15 +543,17 @@ class Template:
             # (e.g. {{my_variable}}) to make things work.
             # This is of course not an ideal solution, and it comes with some
             # overhead, but so far we weren't able to detect a use case where
-            # this could be a blocker (but time will tell).
-            matches = re.findall(r'{{@.*?}}', template_string)
-            for m in set(matches):
-                key = m.strip('{}@').split('.')[0]
-                if key in runtime_data:
-                    template_string = template_string.replace(m, m.replace('@', ''))
+            # this could be a blocker (but time will tell). Nothing can be
+            # rewritten without runtime data or an `{{@` in the source, so
+            # skip the scan in that (common) case.
+            if runtime_data and '{{@' in template_string:
+                for m in set(_LOCAL_VARIABLE_RE.findall(template_string)):
+                    key = m.strip('{}@').split('.')[0]
+                    if key in runtime_data:
+                        template_string = template_string.replace(m, m.replace('@', ''))
 
             # Render the template.
-            result = self._template.render_template(template_string, json.dumps(data))
+            result = self._template.render_template(template_string, _dumps(data))
             logger.debug({'event': 'template_string_rendered'})
             return result
         except ValueError as e:
@@ -590,6 +627,9 @@ class Template:
 class HelperOptions:
     """Handlebars helper options."""
 
+    # A new instance is created for every helper invocation.
+    __slots__ = ('_options',)
+
     def __init__(self, options: HandlebarrzHelperOptions) -> None:
         self._options: HandlebarrzHelperOptions = options
 
@@ -14,6 +14,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+import tempfile
 import unittest
 
 import pytest
@@ -91,9 +93,6 @@ class TemplateCoreTest(unittest.TestCase):
 
     def test_development_mode(self) -> None:
         """Test development mode behavior."""
-        import os
-        import tempfile
-
         # Create a temporary template file
         with tempfile.NamedTemporaryFile(suffix='.hbs', delete=False) as temp_file:
             temp_file.write(b'Hello {{name}}!')
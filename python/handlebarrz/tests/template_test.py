@@ -16,12 +16,19 @@
 
 """Unit tests for handlebarrz Template class."""
 
+import datetime
+import enum
+import json
 import unittest
+import uuid
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
+from unittest import mock
 
 import pytest
 
+import handlebarrz
 from handlebarrz import (
     CompiledRenderer,
     EscapeFunction,
@@ -179,6 +186,52 @@ class TestTemplate(unittest.TestCase):
 
         self.assertEqual(result, 'Hello World!')
 
+    def test_render_template_string_with_runtime_data(self) -> None:
+        """Test that `{{@var}}` resolves from runtime data only when provided."""
+        template = Template()
+
+        result = template.render_template('{{@state.name}}/{{@other}}', {}, {'data': {'state': {'name': 'x'}}})
+        self.assertEqual(result, 'x/')
+
+        self.assertEqual(template.render_template('{{@state.name}}', {'state': {'name': 'x'}}), '')
+
+    def test_render_template_string_reuses_state_changes(self) -> None:
+        """Test that repeated template strings pick up later configuration."""
+        template = Template()
+        self.assertEqual(template.render_template('{{value}}', {'value': '<b>'}), '&lt;b&gt;')
+
+        template.set_escape_function(EscapeFunction.NO_ESCAPE)
+        self.assertEqual(template.render_template('{{value}}', {'value': '<b>'}), '<b>')
+
+        template.strict_mode = True
+        with pytest.raises(ValueError):
+            template.render_template('{{value}}', {})
+
+    def test_render_template_string_from_helper(self) -> None:
+        """Test that a helper can render another template string on the same engine."""
+        template = Template()
+
+        def inner(params: list[Any], options: HelperOptions) -> str:
+            """Test helper."""
+            return '[' + template.render_template('{{v}}', {'v': params[0]}) + ']'
+
+        template.register_helper('inner', inner)
+
+        self.assertEqual(template.render_template('A {{inner "v"}} B', {}), 'A [v] B')
+
+    def test_compiled_renderer_from_helper(self) -> None:
+        """Test that a helper can call a compiled renderer of the same engine."""
+        template = Template()
+        render_inner = template.compile('{{v}}')
+
+        def inner(params: list[Any], options: HelperOptions) -> str:
+            """Test helper."""
+            return '[' + render_inner({'v': params[0]}, None) + ']'
+
+        template.register_helper('inner', inner)
+
+        self.assertEqual(template.compile('A {{inner "v"}} B')({}, None), 'A [v] B')
+
     def test_invalid_template_syntax(self) -> None:
         """Test registering a template with invalid syntax raises ValueError."""
         template = Template()
@@ -193,25 +246,6 @@ class TestTemplate(unittest.TestCase):
         self.assertEqual(html_escape('<script>'), '&lt;script&gt;')
         self.assertEqual(no_escape('<script>'), '<script>')
 
-    def test_template_with_file(self) -> None:
-        """Test registering a template from a file."""
-        import os
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-            template_content = 'Hello {{name}} from file!'
-            temp_file.write(template_content)
-            temp_path = temp_file.name
-
-        try:
-            template = Template()
-            template.register_template_file('file_template', temp_path)
-
-            result = template.render('file_template', {'name': 'World'})
-            self.assertEqual(result, 'Hello World from file!')
-        finally:
-            os.unlink(temp_path)
-
     def test_compile_basic(self) -> None:
         """Test basic template compilation and execution."""
         template = Template()
@@ -262,50 +296,60 @@ class TestTemplate(unittest.TestCase):
             compiled_func({}, None)
 
 
+def test_template_with_file(tmp_path: Path) -> None:
+    """Test registering a template from a file."""
+    template_path = tmp_path / 'template.hbs'
+    template_path.write_text('Hello {{name}} from file!')
+
+    template = Template()
+    template.register_template_file('file_template', str(template_path))
+
+    assert template.render('file_template', {'name': 'World'}) == 'Hello World from file!'
+
+
 class TestTemplateEdgeCases(unittest.TestCase):
     """Test edge cases and error handling for Template class."""
 
+    template: Template
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Share one template registry across the render-only tests."""
+        cls.template = Template()
+
     def test_empty_template(self) -> None:
         """Test that an empty template renders to empty string."""
-        template = Template()
-        template.register_template('empty', '')
-        result = template.render('empty', {'name': 'World'})
+        result = self.template.render_template('', {'name': 'World'})
         self.assertEqual(result, '')
 
     def test_template_with_only_whitespace(self) -> None:
         """Test that a whitespace-only template preserves whitespace."""
-        template = Template()
-        template.register_template('whitespace', '   \n\t  ')
-        result = template.render('whitespace', {})
+        result = self.template.render_template('   \n\t  ', {})
         self.assertEqual(result, '   \n\t  ')
 
     def test_template_with_unicode(self) -> None:
         """Test that templates handle unicode characters correctly."""
-        template = Template()
-        template.register_template('unicode', 'Hello {{name}}! 你好 🎉')
-        result = template.render('unicode', {'name': '世界'})
+        result = self.template.render_template('Hello {{name}}! 你好 🎉', {'name': '世界'})
         self.assertEqual(result, 'Hello 世界! 你好 🎉')
 
     def test_template_with_special_characters_in_data(self) -> None:
         """Test that special characters in data are handled correctly."""
-        template = Template()
-        template.register_template('special', 'Value: {{{value}}}')  # Triple braces = no escape
-        result = template.render('special', {'value': '<div class="test">&amp;</div>'})
+        # Triple braces = no escape
+        result = self.template.render_template('Value: {{{value}}}', {'value': '<div class="test">&amp;</div>'})
         self.assertEqual(result, 'Value: <div class="test">&amp;</div>')
 
     def test_deeply_nested_context(self) -> None:
         """Test that deeply nested context paths work correctly."""
-        template = Template()
-        template.register_template('deep', '{{a.b.c.d.e}}')
         data = {'a': {'b': {'c': {'d': {'e': 'deep_value'}}}}}
-        result = template.render('deep', data)
+        result = self.template.render_template('{{a.b.c.d.e}}', data)
         self.assertEqual(result, 'deep_value')
 
     def test_array_index_access(self) -> None:
         """Test accessing array elements by index."""
-        template = Template()
-        template.register_template('array', '{{items.[0]}} and {{items.[2]}}')
-        result = template.render('array', {'items': ['first', 'second', 'third']})
+        result = self.template.render_template(
+            '{{items.[0]}} and {{items.[2]}}',
+            {'items': ['first', 'second', 'third']},
+        )
         self.assertEqual(result, 'first and third')
 
     def test_multiple_templates(self) -> None:
@@ -331,86 +375,53 @@ class TestTemplateEdgeCases(unittest.TestCase):
         self.assertEqual(result2, 'Version 2: data')
 
 
-class TestUnicodeAndInternationalization(unittest.TestCase):
-    """Test Unicode and internationalization support."""
-
-    def test_hindi_devanagari_script(self) -> None:
-        """Test Hindi text in Devanagari script."""
-        template = Template()
-        template.register_template('hindi', 'नमस्ते {{name}}!')
-        result = template.render('hindi', {'name': 'दुनिया'})
-        self.assertEqual(result, 'नमस्ते दुनिया!')
-
-    def test_arabic_rtl_text(self) -> None:
-        """Test Arabic right-to-left text."""
-        template = Template()
-        template.register_template('arabic', 'مرحبا {{name}}!')
-        result = template.render('arabic', {'name': 'العالم'})
-        self.assertEqual(result, 'مرحبا العالم!')
-
-    def test_japanese_mixed_scripts(self) -> None:
-        """Test Japanese with hiragana, katakana, and kanji."""
-        template = Template()
-        template.register_template('japanese', 'こんにちは {{name}}さん!')
-        result = template.render('japanese', {'name': '田中'})
-        self.assertEqual(result, 'こんにちは 田中さん!')
-
-    def test_korean_hangul(self) -> None:
-        """Test Korean Hangul script."""
-        template = Template()
-        template.register_template('korean', '안녕하세요 {{name}}님!')
-        result = template.render('korean', {'name': '세계'})
-        self.assertEqual(result, '안녕하세요 세계님!')
-
-    def test_chinese_simplified(self) -> None:
-        """Test Simplified Chinese characters."""
-        template = Template()
-        template.register_template('chinese', '你好 {{name}}!')
-        result = template.render('chinese', {'name': '世界'})
-        self.assertEqual(result, '你好 世界!')
-
-    def test_tamil_script(self) -> None:
-        """Test Tamil script."""
-        template = Template()
-        template.register_template('tamil', 'வணக்கம் {{name}}!')
-        result = template.render('tamil', {'name': 'உலகம்'})
-        self.assertEqual(result, 'வணக்கம் உலகம்!')
-
-    def test_emoji_in_template(self) -> None:
-        """Test emoji characters in templates."""
-        template = Template()
-        template.register_template('emoji', '{{greeting}} 🎉🎊 {{name}} 🌍🌎🌏')
-        result = template.render('emoji', {'greeting': 'Hello', 'name': 'World'})
-        self.assertEqual(result, 'Hello 🎉🎊 World 🌍🌎🌏')
-
-    def test_mixed_scripts_in_single_template(self) -> None:
-        """Test multiple scripts in a single template."""
-        template = Template()
-        template.register_template(
-            'mixed',
+@pytest.fixture(scope='module')
+def shared_template() -> Template:
+    """Create one template engine shared by the render-only tests."""
+    return Template()
+
+
+@pytest.mark.parametrize(
+    'template_string,data,expected',
+    [
+        # Hindi text in Devanagari script.
+        ('नमस्ते {{name}}!', {'name': 'दुनिया'}, 'नमस्ते दुनिया!'),
+        # Arabic right-to-left text.
+        ('مرحبا {{name}}!', {'name': 'العالم'}, 'مرحبا العالم!'),
+        # Japanese with hiragana, katakana, and kanji.
+        ('こんにちは {{name}}さん!', {'name': '田中'}, 'こんにちは 田中さん!'),
+        # Korean Hangul script.
+        ('안녕하세요 {{name}}님!', {'name': '세계'}, '안녕하세요 세계님!'),
+        # Simplified Chinese characters.
+        ('你好 {{name}}!', {'name': '世界'}, '你好 世界!'),
+        # Tamil script.
+        ('வணக்கம் {{name}}!', {'name': 'உலகம்'}, 'வணக்கம் உலகம்!'),
+        # Emoji characters in templates.
+        (
+            '{{greeting}} 🎉🎊 {{name}} 🌍🌎🌏',
+            {'greeting': 'Hello', 'name': 'World'},
+            'Hello 🎉🎊 World 🌍🌎🌏',
+        ),
+        # Multiple scripts in a single template.
+        (
             'English: {{en}}, 中文: {{zh}}, हिंदी: {{hi}}, العربية: {{ar}}',
-        )
-        result = template.render(
-            'mixed',
             {'en': 'Hello', 'zh': '你好', 'hi': 'नमस्ते', 'ar': 'مرحبا'},
-        )
-        self.assertEqual(result, 'English: Hello, 中文: 你好, हिंदी: नमस्ते, العربية: مرحبا')
-
-    def test_combining_diacritical_marks(self) -> None:
-        """Test characters with combining diacritical marks."""
-        template = Template()
-        # é can be represented as e + combining acute accent
-        template.register_template('diacritics', 'Café: {{name}}')
-        result = template.render('diacritics', {'name': 'résumé'})
-        self.assertEqual(result, 'Café: résumé')
-
-    def test_zero_width_characters(self) -> None:
-        """Test handling of zero-width characters."""
-        template = Template()
-        # Zero-width joiner (U+200D) is used in some scripts
-        template.register_template('zwj', 'Family: {{emoji}}')
-        result = template.render('zwj', {'emoji': '👨‍👩‍👧‍👦'})  # Family emoji with ZWJ
-        self.assertEqual(result, 'Family: 👨‍👩‍👧‍👦')
+            'English: Hello, 中文: 你好, हिंदी: नमस्ते, العربية: مرحبا',
+        ),
+        # Characters with combining diacritical marks.
+        ('Café: {{name}}', {'name': 'résumé'}, 'Café: résumé'),
+        # Zero-width joiner (U+200D) inside a family emoji.
+        ('Family: {{emoji}}', {'emoji': '👨‍👩‍👧‍👦'}, 'Family: 👨‍👩‍👧‍👦'),
+    ],
+)
+def test_unicode_and_internationalization(
+    shared_template: Template,
+    template_string: str,
+    data: dict[str, Any],
+    expected: str,
+) -> None:
+    """Test that templates render non-ASCII scripts and symbols unchanged."""
+    assert shared_template.render_template(template_string, data) == expected
 
 
 class TestNumericAndBooleanValues(unittest.TestCase):
@@ -461,6 +472,78 @@ class TestNumericAndBooleanValues(unittest.TestCase):
         self.assertIn('10000000000', result)
 
 
+class TestRenderDataSerialization(unittest.TestCase):
+    """Test that render data serializes the same with and without orjson."""
+
+    TEMPLATE = '{{name}} {{count}} {{price}} {{#each tags}}[{{this}}]{{/each}} {{nested.flag}} {{missing}}'
+
+    DATA: dict[str, Any] = {
+        'name': 'caf\u00e9 <b>',
+        'count': 42,
+        'price': 19.99,
+        'tags': ('a', 'b'),
+        'nested': {'flag': True},
+    }
+
+    def render(self, data: dict[str, Any], template: str | None = None) -> str:
+        """Render the test template through the public API."""
+        return Template().render_template(template or self.TEMPLATE, data)
+
+    def render_both(self, data: dict[str, Any], template: str | None = None) -> tuple[str, str, bool]:
+        """Render with and without orjson and report whether json.dumps ran."""
+        with mock.patch.object(json, 'dumps', wraps=json.dumps) as dumps:
+            result = self.render(data, template)
+        with mock.patch('handlebarrz.orjson', None):
+            return result, self.render(data, template), dumps.called
+
+    @unittest.skipIf(handlebarrz.orjson is None, 'orjson is not installed')
+    def test_orjson_matches_standard_library(self) -> None:
+        """Test that orjson encodes the data and matches the json output."""
+        for data in (self.DATA, {**self.DATA, 'missing': None, 'name': 'nullable'}):
+            with_orjson, with_json, fell_back = self.render_both(data)
+            self.assertFalse(fell_back)
+            self.assertEqual(with_orjson, with_json)
+
+    def test_integer_wider_than_64_bits(self) -> None:
+        """Test that integers orjson cannot encode fall back to json."""
+        with_orjson, with_json, fell_back = self.render_both({'n': 2**70}, '{{n}}')
+        self.assertTrue(fell_back)
+        self.assertEqual(with_orjson, with_json)
+
+    def test_non_string_keys(self) -> None:
+        """Test that non-string keys fall back to json."""
+        with_orjson, with_json, fell_back = self.render_both({'m': {1: 'one'}}, '{{m.[1]}}')
+        self.assertTrue(fell_back)
+        self.assertEqual(with_orjson, 'one')
+        self.assertEqual(with_json, 'one')
+
+    def test_enum_and_uuid(self) -> None:
+        """Test that enums and UUIDs render only when orjson is installed."""
+
+        class Color(enum.Enum):
+            RED = 'red'
+
+        data = {'c': Color.RED, 'u': uuid.UUID(int=1)}
+        if handlebarrz.orjson is not None:
+            self.assertEqual(self.render(data, '{{c}} {{u}}'), 'red 00000000-0000-0000-0000-000000000001')
+        with mock.patch('handlebarrz.orjson', None), self.assertRaises(TypeError):
+            self.render(data, '{{c}} {{u}}')
+
+    def test_date_raises_type_error(self) -> None:
+        """Test that dates are still rejected as not JSON serializable."""
+        for orjson in (handlebarrz.orjson, None):
+            with mock.patch('handlebarrz.orjson', orjson), self.assertRaises(TypeError):
+                self.render({'d': datetime.date(2025, 1, 1)}, '{{d}}')
+
+    def test_non_finite_floats(self) -> None:
+        """Test that non-finite floats render as null only with orjson."""
+        for value in (float('nan'), float('inf'), -float('inf')):
+            if handlebarrz.orjson is not None:
+                self.assertEqual(self.render({'v': value}, '[{{v}}]'), '[]')
+            with mock.patch('handlebarrz.orjson', None), self.assertRaises(ValueError):
+                self.render({'v': value}, '{{v}}')
+
+
 class TestHandlebarsAlias(unittest.TestCase):
     """Test that the Handlebars alias works like Template."""
 
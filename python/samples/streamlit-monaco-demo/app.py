@@ -56,6 +56,13 @@ print(parsed["name"])
 {{/role}}
 """
 
+# Monaco editor options. Kept as a plain dict because component arguments
+# are JSON-serialized when sent to the browser.
+EDITOR_OPTIONS = {
+    'minimap': {'enabled': False},
+    'wordWrap': 'on',
+}
+
 col1, col2 = st.columns([2, 1])
 
 with col1:
@@ -71,12 +78,12 @@ with col1:
         height='600px',
         language=LANGUAGE_ID,  # defined in dotprompt_grammar.py
         theme='vs-dark',
-        options={
-            'minimap': {'enabled': False},
-            'wordWrap': 'on',
-        },
+        options=EDITOR_OPTIONS,
     )
 
 with col2:
     st.subheader('Preview / Output')
-    st.text_area('Raw Content', value=content, height=600, disabled=True)
+    # A read-only code block is lighter than a disabled text area and keeps
+    # the same fixed-height scrolling via its container.
+    with st.container(height=600):
+        st.code(content or '', language='handlebars')
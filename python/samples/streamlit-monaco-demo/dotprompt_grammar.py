@@ -16,6 +16,15 @@
 
 LANGUAGE_ID = 'dotprompt'
 
+# Token for the helper name in `{{#name ...}}` and `{{/name}}`.
+_BLOCK_NAME_CASES = {
+    'cases': {
+        '@keywords': 'keyword.handlebars',
+        '@dotpromptHelpers': 'keyword.dotprompt',
+        '@default': 'variable.handlebars',
+    },
+}
+
 # Monarch tokenizer for Dotprompt syntax highlighting.
 # Handles YAML frontmatter, Handlebars templates, and Dotprompt markers.
 monarch_language = {
@@ -49,14 +58,6 @@ monarch_language = {
         'topP',
         'topK',
     ],
-    # Operators and brackets
-    'brackets': [
-        {'open': '{{', 'close': '}}', 'token': 'delimiter.handlebars'},
-        {'open': '{{#', 'close': '}}', 'token': 'delimiter.handlebars.block'},
-        {'open': '{{/', 'close': '}}', 'token': 'delimiter.handlebars.block'},
-        {'open': '{', 'close': '}', 'token': 'delimiter.curly'},
-        {'open': '[', 'close': ']', 'token': 'delimiter.square'},
-    ],
     'tokenizer': {
         'root': [
             # License header comments (lines starting with #)
@@ -88,7 +89,7 @@ monarch_language = {
                 ],
             ],
             # YAML strings
-            [r'"([^"\\]|\\.)*$', 'string.invalid'],  # non-terminated string
+            [r'"[^"\\]*(?:\\.[^"\\]*)*$', 'string.invalid'],  # non-terminated string
             [r'"', {'token': 'string.quote', 'next': '@yamlDoubleString'}],
             [r"'", {'token': 'string.quote', 'next': '@yamlSingleString'}],
             # YAML numbers
@@ -118,13 +119,7 @@ monarch_language = {
                 [
                     'delimiter.handlebars.block',
                     '',
-                    {
-                        'cases': {
-                            '@keywords': 'keyword.handlebars',
-                            '@dotpromptHelpers': 'keyword.dotprompt',
-                            '@default': 'variable.handlebars',
-                        },
-                    },
+                    _BLOCK_NAME_CASES,
                 ],
             ],
             # Handlebars block end {{/helper}}
@@ -133,13 +128,7 @@ monarch_language = {
                 [
                     'delimiter.handlebars.block',
                     '',
-                    {
-                        'cases': {
-                            '@keywords': 'keyword.handlebars',
-                            '@dotpromptHelpers': 'keyword.dotprompt',
-                            '@default': 'variable.handlebars',
-                        },
-                    },
+                    _BLOCK_NAME_CASES,
                     '',
                     'delimiter.handlebars.block',
                 ],
@@ -162,9 +151,8 @@ monarch_language = {
                 r'\{\{',
                 {'token': 'delimiter.handlebars', 'next': '@handlebarsExpression'},
             ],
-            # Plain text
-            [r'[^{<]+', ''],
-            [r'.', ''],
+            # Plain text, or a '{' or '<' that did not start anything above
+            [r'[^{<]+|[{<]', ''],
         ],
         'handlebarsExpression': [
             # Close expression
@@ -180,9 +168,9 @@ monarch_language = {
                     },
                 },
             ],
-            # Strings in expressions
-            [r'"([^"\\]|\\.)*"', 'string'],
-            [r"'([^'\\]|\\.)*'", 'string'],
+            # Strings in expressions (unrolled to avoid a capture per character)
+            [r'"[^"\\]*(?:\\.[^"\\]*)*"', 'string'],
+            [r"'[^'\\]*(?:\\.[^'\\]*)*'", 'string'],
             # Numbers
             [r'\d+', 'number'],
             # Operators
@@ -205,6 +193,16 @@ monarch_language = {
     },
 }
 
+# Pairs that are both auto-closed and used to surround a selection.
+_PAIRS = [
+    {'open': '{{', 'close': '}}'},
+    {'open': '{', 'close': '}'},
+    {'open': '[', 'close': ']'},
+    {'open': '(', 'close': ')'},
+    {'open': '"', 'close': '"'},
+    {'open': "'", 'close': "'"},
+]
+
 # Language configuration for Dotprompt.
 # Provides bracket matching, auto-closing, and comment toggling.
 language_configuration = {
@@ -219,22 +217,8 @@ language_configuration = {
         ['[', ']'],
         ['(', ')'],
     ],
-    'autoClosingPairs': [
-        {'open': '{{', 'close': '}}'},
-        {'open': '{', 'close': '}'},
-        {'open': '[', 'close': ']'},
-        {'open': '(', 'close': ')'},
-        {'open': '"', 'close': '"'},
-        {'open': "'", 'close': "'"},
-    ],
-    'surroundingPairs': [
-        {'open': '{{', 'close': '}}'},
-        {'open': '{', 'close': '}'},
-        {'open': '[', 'close': ']'},
-        {'open': '(', 'close': ')'},
-        {'open': '"', 'close': '"'},
-        {'open': "'", 'close': "'"},
-    ],
+    'autoClosingPairs': _PAIRS,
+    'surroundingPairs': _PAIRS,
     # Folding and Indentation rules are regex-heavy and might not transfer easily via JSON without
     # manual regex object reconstruction on JS side. We limit to basic configuration for now.
     # If the Streamlit component supports regex strings for these, we could add them.